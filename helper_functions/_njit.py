@@ -0,0 +1,20 @@
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, fall back to plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        No-op stand-in for `numba.njit` used when numba is not installed.
+
+        Supports both the bare `@njit` and the parameterised
+        `@njit(cache=True, ...)` decorator forms, returning the decorated
+        function unchanged.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
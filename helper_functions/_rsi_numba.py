@@ -0,0 +1,90 @@
+import numpy as np
+
+from helper_functions._njit import njit, prange
+
+# explicit signatures compile the kernels eagerly at import (or load them from the
+# on-disk cache), so the first rsi call does not pay the JIT compilation cost.
+# fastmath is deliberately not used, it assumes there are no NaNs and would make the
+# NaN handling in `_rsi_core` undefined
+_POINT_RSI_SIGNATURES = ["float64(float64, float64)"]
+_RSI_CORE_SIGNATURES = [
+    "void(float64[::1], int64, float64[::1])",
+    "void(float32[::1], int64, float32[::1])",
+]
+_RSI_MULTI_SIGNATURES = [
+    "void(float64[::1], int64[::1], float64[:, ::1])",
+    "void(float32[::1], int64[::1], float32[:, ::1])",
+]
+
+
+@njit(_POINT_RSI_SIGNATURES, cache=True)
+def _calculate_point_rsi(mean_upward: float, mean_downward: float) -> float:
+    """
+    Calculates the Relative Strength Index (RSI) based on mean upward and mean downward price movements.
+
+    Args:
+        mean_upward (float): The average of upward price movements.
+        mean_downward (float): The average of downward price movements.
+
+    Returns:
+        float: The RSI value, ranging from 0 to 100. If `mean_downward` is 0, the function returns 100.
+    """
+    return (
+        100.0 - 100.0 / (1.0 + mean_upward / mean_downward)
+        if mean_downward > 0
+        else 100.0
+    )
+
+
+@njit(_RSI_CORE_SIGNATURES, cache=True)
+def _rsi_core(deltas: np.ndarray, period: int, out: np.ndarray) -> None:
+    """
+    Runs Wilder's smoothing over the price changes and writes the RSI values into `out`.
+
+    Args:
+        deltas (np.ndarray): A contiguous float array of consecutive price changes.
+        period (int): The lookback period to calculate the RSI.
+        out (np.ndarray): A preallocated array of length `len(deltas) + 1`. Positions from
+                          `period` onwards are overwritten, earlier positions are left untouched.
+
+    Notes:
+        - A NaN price change is treated as no change, so a single missing price does not
+          poison the smoothed averages for the rest of the series.
+    """
+    mean_upward = 0.0
+    mean_downward = 0.0
+    for i in range(period):
+        if deltas[i] > 0:
+            mean_upward += deltas[i]
+        elif deltas[i] < 0:
+            mean_downward -= deltas[i]
+    mean_upward /= period
+    mean_downward /= period
+
+    out[period] = _calculate_point_rsi(mean_upward, mean_downward)
+
+    for i in range(period, len(deltas)):
+        upward = deltas[i] if deltas[i] > 0 else 0.0
+        downward = -deltas[i] if deltas[i] < 0 else 0.0
+
+        mean_upward = (mean_upward * (period - 1) + upward) / period
+        mean_downward = (mean_downward * (period - 1) + downward) / period
+
+        out[i + 1] = _calculate_point_rsi(mean_upward, mean_downward)
+
+
+@njit(_RSI_MULTI_SIGNATURES, cache=True, parallel=True)
+def _rsi_multi(
+    deltas: np.ndarray, periods: np.ndarray, out: np.ndarray
+) -> None:
+    """
+    Runs `_rsi_core` for several lookback periods over the same price changes.
+
+    Args:
+        deltas (np.ndarray): A contiguous float array of consecutive price changes.
+        periods (np.ndarray): An int64 array of lookback periods.
+        out (np.ndarray): A preallocated array of shape `(len(periods), len(deltas) + 1)`,
+                          one row per period, filled as described in `_rsi_core`.
+    """
+    for j in prange(len(periods)):
+        _rsi_core(deltas, periods[j], out[j])
@@ -1,79 +1,235 @@
 import pandas as pd
 import numpy as np
 
+from helper_functions._rsi_numba import _rsi_core, _rsi_multi
 
-def sma(values: np.array, n: int) -> pd.Series:
+
+def sma(
+    values: np.array,
+    n: int,
+    dtype: np.dtype = np.float64,
+    as_series: bool = False,
+) -> np.ndarray | pd.Series:
     """
     Computes the Simple Moving Average (SMA) of a NumPy array over a window of size `n`.
 
+    The moving sums are taken as differences of a single cumulative sum, so the cost
+    is O(len(values)) regardless of the window size.
+
     Args:
         values (np.array): A 1D array of numerical values.
         n (int): The window size for the moving average.
+        dtype (np.dtype): The floating point dtype of the returned array. The running sum
+                          is always accumulated in float64 to avoid cancellation error.
+        as_series (bool): If True, wrap the result in a Pandas Series, keeping the index
+                          of `values` when it is a Pandas Series.
 
     Returns:
-        pd.Series: A Pandas Series containing the SMA, with NaN for the first `n-1` values.
+        np.ndarray | pd.Series: An array containing the SMA, with NaN for the first `n-1`
+                                values and for any window containing a non-finite value
+                                (NaN or +/-inf), matching `pd.Series.rolling(n).mean()`.
+                                A Pandas Series if `as_series` is True.
+
+    Raises:
+        ValueError: If `n` is smaller than 1, or if `dtype` is not a floating point dtype.
     """
-    return pd.Series(values).rolling(n).mean()
+    if n < 1:
+        raise ValueError("The window size `n` must be at least 1.")
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError(
+            f"The SMA can only be returned as a floating point dtype, not {np.dtype(dtype)}."
+        )
+
+    index = values.index if isinstance(values, pd.Series) else None
+    values = np.ascontiguousarray(values, dtype=np.float64)
+
+    missing = ~np.isfinite(values)
+    has_missing = missing.any()
+    if has_missing:
+        # zero out NaNs and infs so they do not poison every later cumulative sum
+        values = np.where(missing, 0.0, values)
+
+    cumulative = np.empty(values.size + 1)
+    cumulative[0] = 0.0
+    np.cumsum(values, out=cumulative[1:])
+
+    out = np.full(values.size, np.nan, dtype=dtype)
+    out[n - 1 :] = (cumulative[n:] - cumulative[:-n]) / n
+
+    if has_missing:
+        missing_count = np.zeros(values.size + 1, dtype=np.int64)
+        np.cumsum(missing, out=missing_count[1:])
+        window_missing = (missing_count[n:] - missing_count[:-n]) > 0
+        out[n - 1 :][window_missing] = np.nan
 
+    if as_series:
+        return pd.Series(out, index=index)
 
-def _calculate_point_rsi(mean_upward: float, mean_downward: float) -> float:
+    return out
+
+
+def sma_update(
+    previous_sma: float, entering_value: float, leaving_value: float, n: int
+) -> float:
     """
-    Calculates the Relative Strength Index (RSI) based on mean upward and mean downward price movements.
+    Rolls an existing SMA forward by one observation.
+
+    Intended for bar-by-bar backtests driven from Python, such as a backtesting.py
+    `Strategy.next`, where recomputing the full window on every new bar would cost `n`
+    operations instead of two. This is a plain Python function rather than a numba
+    kernel, since jit dispatch would cost more than the update itself.
 
     Args:
-        mean_upward (float): The average of upward price movements.
-        mean_downward (float): The average of downward price movements.
+        previous_sma (float): The SMA over the previous `n` values.
+        entering_value (float): The newest value, entering the window.
+        leaving_value (float): The oldest value, leaving the window.
+        n (int): The window size for the moving average.
 
     Returns:
-        float: The RSI value, ranging from 0 to 100. If `mean_downward` is 0, the function returns 100.
+        float: The SMA over the updated window.
+
+    Example:
+        >>> prices = np.array([1.0, 2.0, 3.0, 4.0])
+        >>> sma_update(2.0, prices[3], prices[0], 3)
+        np.float64(3.0)
+    """
+    return previous_sma + (entering_value - leaving_value) / n
+
+
+def _check_rsi_dtype(dtype: np.dtype) -> None:
     """
-    if mean_downward != 0:
-        relative_strength = mean_upward / mean_downward
-        return 100 - 100 / (1 + relative_strength)
-    else:
-        return 100
+    Checks that a dtype is supported by the compiled RSI kernels.
+
+    Args:
+        dtype (np.dtype): The requested floating point dtype.
+
+    Raises:
+        ValueError: If `dtype` is not float32 or float64.
+    """
+    if np.dtype(dtype) not in (np.float32, np.float64):
+        raise ValueError(
+            f"RSI can only be calculated as float32 or float64, not {np.dtype(dtype)}."
+        )
 
 
-def rsi(prices: np.array, period: int) -> np.ndarray:
+def rsi(
+    prices: np.array, period: int, dtype: np.dtype = np.float64
+) -> np.ndarray:
     """
     Calculates the Relative Strength Index (RSI) for a given price series.
 
     Args:
         prices (pd.Series): The closing prices of the asset as a pandas Series.
         period (int): The lookback period to calculate the RSI.
+        dtype (np.dtype): The floating point dtype used for the calculation, either
+                          float32 or float64. float32 halves memory traffic at the cost
+                          of precision.
 
     Returns:
         np.ndarray: An array of RSI values, where the first `period` values will be zeros
                     because RSI cannot be calculated until `period` data points are available.
 
     Raises:
-        ValueError: If the input prices series contains fewer than `period` data points.
+        ValueError: If `period` is not an integer of at least 1, if `dtype` is not float32
+                    or float64, or if the input prices series contains `period` or fewer
+                    data points.
+
+    Notes:
+        - A missing (NaN) price makes the price changes either side of it NaN, and these
+          are treated as no change rather than propagating through the smoothing.
 
     Example:
         prices = pd.Series([44, 46, 45, 47, 44, 43, 42, 43, 44, 45])
         rsi_values = calculate_rsi(prices, 5)
+
+        >>> prices = np.array([44.0, 46.0, 45.0, np.nan, 44.0, 43.0, 42.0, 43.0, 44.0])
+        >>> rsi(prices, 3).round(2)
+        array([ 0.  ,  0.  ,  0.  , 66.67, 66.67, 38.1 , 23.19, 51.6 , 68.87])
     """
-    prices = np.asarray(prices)
-    deltas = np.diff(prices)
+    if (
+        not isinstance(period, (int, np.integer))
+        or isinstance(period, bool)
+        or period < 1
+    ):
+        raise ValueError(
+            f"The lookback `period` must be an integer of at least 1, not {period!r}."
+        )
+
+    _check_rsi_dtype(dtype)
+    prices = np.ascontiguousarray(prices, dtype=dtype)
+
+    if len(prices) <= period:
+        raise ValueError(
+            f"At least {period + 1} prices are required to calculate a {period} period RSI."
+        )
+
+    rsi = np.zeros(len(prices), dtype=dtype)
+    _rsi_core(np.diff(prices), period, rsi)
+
+    return rsi
 
-    upward_changes = np.where(deltas > 0, deltas, 0)
-    downward_changes = np.where(deltas < 0, -deltas, 0)
 
-    rsi = np.zeros(len(prices))
+def rsi_multi(
+    prices: np.array, periods: list[int], dtype: np.dtype = np.float64
+) -> np.ndarray:
+    """
+    Calculates the Relative Strength Index (RSI) for several lookback periods at once.
 
-    mean_upward = np.mean(upward_changes[:period])
-    mean_downward = np.mean(downward_changes[:period])
+    The price changes are computed a single time and shared by every period, rather
+    than being recomputed by a separate `rsi` call per period.
 
-    rsi[period] = _calculate_point_rsi(mean_upward, mean_downward)
+    Args:
+        prices (pd.Series): The closing prices of the asset as a pandas Series.
+        periods (list[int]): The lookback periods to calculate the RSI for.
+        dtype (np.dtype): The floating point dtype used for the calculation, either
+                          float32 or float64. float32 halves memory traffic at the cost
+                          of precision.
 
-    for i in range(period + 1, len(prices)):
-        mean_upward = (
-            mean_upward * (period - 1) + upward_changes[i - 1]
-        ) / period
-        mean_downward = (
-            mean_downward * (period - 1) + downward_changes[i - 1]
-        ) / period
+    Returns:
+        np.ndarray: An array of shape `(len(prices), len(periods))` where column `j`
+                    equals `rsi(prices, periods[j])`. This is a transposed, Fortran-ordered
+                    view of a `(len(periods), len(prices))` C-ordered array, so each column
+                    is contiguous but the rows are not. Use `np.ascontiguousarray` on the
+                    result if a C-ordered array is needed.
 
-        rsi[i] = _calculate_point_rsi(mean_upward, mean_downward)
+    Raises:
+        ValueError: If `dtype` is not float32 or float64, if `periods` is empty or
+                    contains a period that is not an integer of at least 1, or if the
+                    input prices series contains `max(periods)` or fewer data points.
 
-    return rsi
+    Example:
+        prices = pd.Series([44, 46, 45, 47, 44, 43, 42, 43, 44, 45])
+        rsi_values = rsi_multi(prices, [3, 5])
+    """
+    _check_rsi_dtype(dtype)
+    prices = np.ascontiguousarray(prices, dtype=dtype)
+    has_bool = any(
+        isinstance(period, bool)
+        for period in np.ravel(np.asarray(periods, dtype=object))
+    )
+    periods = np.asarray(periods)
+
+    if periods.ndim != 1 or periods.size == 0:
+        raise ValueError(
+            "`periods` must be a non-empty list of lookback periods."
+        )
+    if (
+        has_bool
+        or not np.issubdtype(periods.dtype, np.integer)
+        or periods.min() < 1
+    ):
+        raise ValueError(
+            "Every lookback period in `periods` must be an integer of at least 1."
+        )
+
+    periods = periods.astype(np.int64, copy=False)
+
+    if len(prices) <= periods.max():
+        raise ValueError(
+            f"At least {periods.max() + 1} prices are required to calculate a {periods.max()} period RSI."
+        )
+
+    rsi = np.zeros((len(periods), len(prices)), dtype=dtype)
+    _rsi_multi(np.diff(prices), periods, rsi)
+
+    return rsi.T
@@ -2,6 +2,27 @@ import plotly.graph_objects as go
 import pandas as pd
 import matplotlib.pyplot as plt
 
+_OHLC_COLUMNS = ("Open", "High", "Low", "Close")
+
+
+def _validate_ohlc(data: pd.DataFrame) -> None:
+    """
+    Checks that a DataFrame contains the columns needed to build a candlestick chart.
+
+    Args:
+        data (pd.DataFrame): The input DataFrame.
+
+    Raises:
+        ValueError: If any of the required columns ('Open', 'High', 'Low', 'Close') are missing.
+    """
+    missing_columns = [
+        col for col in _OHLC_COLUMNS if col not in data.columns
+    ]  # find required columns not present in data
+    if missing_columns:
+        raise ValueError(
+            f"Missing required columns: {', '.join(missing_columns)}"
+        )
+
 
 def create_candlestick(data: pd.DataFrame) -> go.Candlestick:
     """
@@ -41,15 +62,7 @@ def create_candlestick(data: pd.DataFrame) -> go.Candlestick:
     if not isinstance(data.index, pd.DatetimeIndex):
         raise ValueError("The DataFrame must be indexed by a `DatetimeIndex`.")
 
-    required_columns = ["Open", "High", "Low", "Close"]
-
-    missing_columns = [
-        col for col in required_columns if col not in data.columns
-    ]  # find required columns not present in data
-    if missing_columns:
-        raise ValueError(
-            f"Missing required columns: {', '.join(missing_columns)}"
-        )
+    _validate_ohlc(data)
 
     return go.Candlestick(
         x=data.index,
@@ -60,6 +73,66 @@ def create_candlestick(data: pd.DataFrame) -> go.Candlestick:
     )
 
 
+def create_candlesticks(
+    data: pd.DataFrame, level: str = "Ticker"
+) -> dict[str, go.Candlestick]:
+    """
+    Create one candlestick chart object per asset from a multi-asset financial DataFrame.
+
+    The column check is run once for the whole DataFrame, and each Plotly Candlestick
+    is built from NumPy arrays rather than Pandas Series, which avoids the per-asset
+    validation overhead of calling `create_candlestick` in a loop.
+
+    Args:
+        data (pd.DataFrame): The input DataFrame. The DataFrame must meet the following requirements:
+            - It must be indexed by a two level `MultiIndex`, one level named `level`
+              identifying the asset and the other containing datetimes.
+            - It must contain the 'Open', 'High', 'Low' and 'Close' columns, as
+              described in `create_candlestick`.
+        level (str): The name of the index level identifying the asset.
+
+    Returns:
+        dict[str, go.Candlestick]: A mapping from each asset to its Plotly Candlestick object,
+                                   in order of first appearance.
+
+    Raises:
+        ValueError: If the DataFrame is not indexed by a two level `MultiIndex` containing
+        `level` and a datetime level, or if any of the required columns are missing.
+
+    Example:
+        >>> candlesticks = create_candlesticks(df, level="Ticker")
+        >>> fig = go.Figure(data=[candlesticks["GOOG"]])
+    """
+    if not (
+        isinstance(data.index, pd.MultiIndex)
+        and data.index.nlevels == 2
+        and level in data.index.names
+    ):
+        raise ValueError(
+            f"The DataFrame must be indexed by a two level `MultiIndex` including `{level}`."
+        )
+
+    date_level = 1 - data.index.names.index(level)
+    if not pd.api.types.is_datetime64_any_dtype(data.index.levels[date_level]):
+        raise ValueError(
+            "The DataFrame index must have a level containing datetimes."
+        )
+
+    _validate_ohlc(data)
+
+    candlesticks = {}
+    for asset, asset_data in data.groupby(level=level, sort=False):
+        candlesticks[asset] = go.Candlestick(
+            x=asset_data.index.get_level_values(date_level).to_numpy(),
+            open=asset_data["Open"].to_numpy(),
+            high=asset_data["High"].to_numpy(),
+            low=asset_data["Low"].to_numpy(),
+            close=asset_data["Close"].to_numpy(),
+        )
+
+    return candlesticks
+
+
 def plot_position(
     price_data: pd.DataFrame, position_data: pd.DataFrame, asset_label: str
 ) -> None: